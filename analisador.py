@@ -1,51 +1,56 @@
 import re
-from enum import Enum
+import sys
+from array import array
+from bisect import bisect_left
+from enum import IntEnum
 from dataclasses import dataclass
-from typing import List, Optional, Any
+from typing import Any, ClassVar, Dict, Iterator, List, Optional, Tuple, Union
 
 # Definindo os tipos de tokens que nossa linguagem reconhece
-class TokenType(Enum):
+class TokenType(IntEnum):
+    # Valores inteiros (IntEnum): comparar tipos de token é comparar ints
+    
     # Literais
-    NUMBER = "NUMBER"          # 123, 3.14
-    STRING = "STRING"          # "hello"
-    IDENTIFIER = "IDENTIFIER"  # variáveis, nomes
+    NUMBER = 1          # 123, 3.14
+    STRING = 2          # "hello"
+    IDENTIFIER = 3      # variáveis, nomes
     
     # Operadores aritméticos
-    PLUS = "PLUS"             # +
-    MINUS = "MINUS"           # -
-    MULTIPLY = "MULTIPLY"     # *
-    DIVIDE = "DIVIDE"         # /
+    PLUS = 4            # +
+    MINUS = 5           # -
+    MULTIPLY = 6        # *
+    DIVIDE = 7          # /
     
     # Operadores de comparação
-    EQUAL = "EQUAL"           # ==
-    NOT_EQUAL = "NOT_EQUAL"   # !=
-    LESS_THAN = "LESS_THAN"   # <
-    GREATER_THAN = "GREATER_THAN" # >
-    LESS_EQUAL = "LESS_EQUAL"     # <=
-    GREATER_EQUAL = "GREATER_EQUAL" # >=
+    EQUAL = 8           # ==
+    NOT_EQUAL = 9       # !=
+    LESS_THAN = 10      # <
+    GREATER_THAN = 11   # >
+    LESS_EQUAL = 12     # <=
+    GREATER_EQUAL = 13  # >=
     
     # Operador de atribuição
-    ASSIGN = "ASSIGN"         # =
+    ASSIGN = 14         # =
     
     # Delimitadores
-    LEFT_PAREN = "LEFT_PAREN"   # (
-    RIGHT_PAREN = "RIGHT_PAREN" # )
-    LEFT_BRACKET = "LEFT_BRACKET"   # [
-    RIGHT_BRACKET = "RIGHT_BRACKET" # ]
-    COMMA = "COMMA"           # ,
+    LEFT_PAREN = 15     # (
+    RIGHT_PAREN = 16    # )
+    LEFT_BRACKET = 17   # [
+    RIGHT_BRACKET = 18  # ]
+    COMMA = 19          # ,
     
     # Palavras-chave
-    IF = "IF"
-    WHILE = "WHILE"
-    FOR = "FOR"
-    PRINT = "PRINT"
+    IF = 20
+    WHILE = 21
+    FOR = 22
+    PRINT = 23
     
     # Controle
-    NEWLINE = "NEWLINE"       # \n
-    EOF = "EOF"               # fim do arquivo
-    WHITESPACE = "WHITESPACE" # espaços, tabs
+    NEWLINE = 24        # \n
+    EOF = 25            # fim do arquivo
+    WHITESPACE = 26     # espaços, tabs
 
-@dataclass
+@dataclass(slots=True)
 class Token:
     """
     Representa um token (unidade léxica) do código
@@ -62,7 +67,198 @@ class Token:
     column: int
     
     def __str__(self):
-        return f"Token({self.type.value}, '{self.value}', {self.line}:{self.column})"
+        return f"Token({self.type.name}, '{self.value}', {self.line}:{self.column})"
+
+class _SharedToken(Token):
+    """
+    Token imutável, compartilhado entre todos os lexers
+    
+    Usado para os tokens de valor fixo de tokenize(positions=False), que
+    têm linha e coluna 0. Qualquer atribuição levanta AttributeError, então
+    alterar um deles não afeta os tokens dos outros lexers. Fora isso se
+    comporta como Token: mesmo construtor, igualdade e repr.
+    """
+    __slots__ = ()
+    
+    def __init__(self, type: TokenType, value: str, line: int = 0, column: int = 0):
+        object.__setattr__(self, 'type', type)
+        object.__setattr__(self, 'value', value)
+        object.__setattr__(self, 'line', line)
+        object.__setattr__(self, 'column', column)
+    
+    def __eq__(self, other):
+        # O __eq__ do dataclass exige a mesma classe; aqui vale qualquer Token
+        if not isinstance(other, Token):
+            return NotImplemented
+        return ((self.type, self.value, self.line, self.column) ==
+                (other.type, other.value, other.line, other.column))
+    
+    __hash__ = None  # como Token, que é mutável
+    
+    def __repr__(self):
+        return (f"Token(type={self.type!r}, value={self.value!r}, "
+                f"line={self.line!r}, column={self.column!r})")
+    
+    def __reduce__(self):
+        # copy e pickle recriam pelo construtor, já que __setattr__ é bloqueado
+        return (type(self), (self.type, self.value, self.line, self.column))
+    
+    def __setattr__(self, name, value):
+        raise AttributeError(f"token compartilhado não pode ser alterado ('{name}')")
+    
+    def __delattr__(self, name):
+        raise AttributeError(f"token compartilhado não pode ser alterado ('{name}')")
+
+# Sequências de escape dentro de strings: \n e \t viram os caracteres
+# correspondentes; qualquer outra (\\, \", \') vira o próprio caractere
+_ESCAPES = {'n': '\n', 't': '\t'}
+_ESCAPE_PATTERN = re.compile(r'\\(.)', re.DOTALL)
+
+def _unescape(body: str) -> str:
+    """Resolve as sequências de escape do conteúdo de uma string"""
+    if '\\' not in body:
+        return body
+    return _ESCAPE_PATTERN.sub(lambda m: _ESCAPES.get(m.group(1), m.group(1)), body)
+
+def _newline_offsets(text: str) -> array:
+    """Retorna as posições de todas as quebras de linha do texto, em ordem"""
+    offsets = array('I')
+    index = text.find('\n')
+    while index != -1:
+        offsets.append(index)
+        index = text.find('\n', index + 1)
+    return offsets
+
+def _location(newlines: array, offset: int) -> Tuple[int, int]:
+    """
+    Converte uma posição do texto em (linha, coluna), ambas a partir de 1
+    
+    newlines são as posições das quebras de linha (ver _newline_offsets);
+    uma busca binária conta quantas vêm antes de offset.
+    """
+    index = bisect_left(newlines, offset)
+    line_start = newlines[index - 1] + 1 if index else 0
+    return index + 1, offset - line_start + 1
+
+class TokenStream:
+    """
+    Sequência de tokens guardada em colunas (estrutura de arrays)
+    
+    Em vez de um objeto Token por token, guarda arrays paralelos de inteiros:
+    - types: tipo de cada token (valor do TokenType)
+    - starts: posição do token no texto
+    - lengths: tamanho do token no texto
+    
+    O parser pode ler stream.types[i] direto (uma leitura de inteiro). Os
+    valores são fatiados do texto e os objetos Token só são criados quando
+    pedidos (stream[i] ou iteração), o que mantém compatibilidade com quem
+    trata o resultado de tokenize() como uma lista de tokens. Linha e coluna
+    também são calculadas só quando pedidas, a partir da posição no texto.
+    """
+    
+    # TokenType a partir do valor inteiro guardado em types
+    _TYPES: ClassVar[Dict[int, TokenType]] = {token_type.value: token_type for token_type in TokenType}
+    
+    def __init__(self, text: str, shared: Optional[Dict[Tuple[TokenType, str], Token]] = None):
+        self.text = text
+        self.types = array('B')
+        self.starts = array('I')
+        self.lengths = array('I')
+        self._newlines: Optional[array] = None  # montado na primeira consulta de posição
+        self._shared = shared  # tokens de valor fixo reaproveitados (ver Lexer.tokenize)
+    
+    def __len__(self) -> int:
+        return len(self.types)
+    
+    def value(self, index: int) -> str:
+        """Retorna o valor do token na posição index, fatiado do texto"""
+        token_type = self.types[index]
+        start = self.starts[index]
+        if token_type == TokenType.NEWLINE:
+            return '\\n'
+        if token_type == TokenType.STRING:
+            return _unescape(self.text[start + 1:start + self.lengths[index] - 1])
+        if token_type == TokenType.IDENTIFIER:
+            # Nomes internados: comparações e chaves de dicionário com o
+            # mesmo nome passam a ser o mesmo objeto
+            return sys.intern(self.text[start:start + self.lengths[index]])
+        return self.text[start:start + self.lengths[index]]
+    
+    def location(self, index: int) -> Tuple[int, int]:
+        """Retorna (linha, coluna) do token na posição index"""
+        return _location(self._line_index(), self.starts[index])
+    
+    def offset_location(self, offset: int) -> Tuple[int, int]:
+        """Retorna (linha, coluna) de uma posição qualquer do texto"""
+        return _location(self._line_index(), offset)
+    
+    def _line_index(self) -> array:
+        """
+        Retorna as posições das quebras de linha do texto
+        
+        O índice é montado uma única vez, na primeira consulta de posição
+        (location, offset_location ou iteração), e serve também a
+        Lexer.location.
+        """
+        if self._newlines is None:
+            self._newlines = _newline_offsets(self.text)
+        return self._newlines
+    
+    def __getitem__(self, index: Union[int, slice]) -> Union[Token, List[Token]]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("índice de token fora do intervalo")
+        token_type = self._TYPES[self.types[index]]
+        value = self.value(index)
+        if self._shared is not None:
+            token = self._shared.get((token_type, value))
+            if token is not None:
+                return token
+        line, column = self.location(index)
+        return Token(token_type, value, line, column)
+    
+    def __iter__(self) -> Iterator[Token]:
+        # Mesmo resultado de self[index] para cada índice, mas a linha avança
+        # junto com os tokens (que estão em ordem no texto) em vez de uma
+        # busca binária por token
+        text = self.text
+        types_by_value = self._TYPES
+        shared = self._shared
+        newlines = self._line_index()
+        newline_count = len(newlines)
+        intern = sys.intern
+        newline_type = TokenType.NEWLINE.value
+        string_type = TokenType.STRING.value
+        identifier_type = TokenType.IDENTIFIER.value
+        
+        line_index = 0  # quebras de linha antes do token atual
+        line_start = 0
+        next_newline = newlines[0] if newline_count else len(text)
+        for type_value, start, length in zip(self.types, self.starts, self.lengths):
+            if type_value == identifier_type:
+                value = intern(text[start:start + length])
+            elif type_value == newline_type:
+                value = '\\n'
+            elif type_value == string_type:
+                value = _unescape(text[start + 1:start + length - 1])
+            else:
+                value = text[start:start + length]
+            token_type = types_by_value[type_value]
+            
+            if shared is not None:
+                token = shared.get((token_type, value))
+                if token is not None:
+                    yield token
+                    continue
+            
+            while next_newline < start:
+                line_index += 1
+                line_start = next_newline + 1
+                next_newline = newlines[line_index] if line_index < newline_count else len(text)
+            yield Token(token_type, value, line_index + 1, start - line_start + 1)
 
 class Lexer:
     """
@@ -72,223 +268,182 @@ class Lexer:
     É o primeiro passo na análise de qualquer linguagem de programação.
     
     Processo:
-    1. Lê o código caractere por caractere
+    1. Percorre o código com uma única expressão regular
     2. Identifica padrões (números, palavras, operadores)
     3. Cria tokens correspondentes
     4. Retorna lista de tokens para o parser
     """
     
+    # Tabelas da classe: montadas uma única vez e compartilhadas por todas as
+    # instâncias (nenhuma delas é alterada depois)
+    
+    # Palavras-chave da linguagem
+    KEYWORDS: ClassVar[Dict[str, TokenType]] = {
+        'if': TokenType.IF,
+        'while': TokenType.WHILE,
+        'for': TokenType.FOR,
+        'print': TokenType.PRINT,
+    }
+    
+    # Palavras-chave indexadas por (tamanho, primeira letra). Nenhum par de
+    # palavras-chave compartilha os dois, então basta uma consulta ao dicionário
+    # e, só em caso de acerto, uma comparação de strings
+    _KW_BY_LEN_CHAR: ClassVar[Dict[Tuple[int, str], Tuple[str, TokenType]]] = {
+        (len(word), word[0]): (word, token_type) for word, token_type in KEYWORDS.items()
+    }
+    
+    # Operadores reconhecidos (de um e de dois caracteres)
+    OPERATORS: ClassVar[Dict[str, TokenType]] = {
+        '==': TokenType.EQUAL,
+        '!=': TokenType.NOT_EQUAL,
+        '<=': TokenType.LESS_EQUAL,
+        '>=': TokenType.GREATER_EQUAL,
+        '+': TokenType.PLUS,
+        '-': TokenType.MINUS,
+        '*': TokenType.MULTIPLY,
+        '/': TokenType.DIVIDE,
+        '=': TokenType.ASSIGN,
+        '<': TokenType.LESS_THAN,
+        '>': TokenType.GREATER_THAN,
+        '(': TokenType.LEFT_PAREN,
+        ')': TokenType.RIGHT_PAREN,
+        '[': TokenType.LEFT_BRACKET,
+        ']': TokenType.RIGHT_BRACKET,
+        ',': TokenType.COMMA,
+    }
+    
+    # Expressão regular mestre: uma alternativa nomeada para cada classe de token.
+    # Cada alternativa começa por um conjunto de caracteres próprio (em OP, os
+    # operadores de dois caracteres vêm antes dos de um), então no máximo
+    # uma delas avança a partir de cada posição e não há retrocesso. A ordem segue
+    # a frequência: espaços, nomes e operadores primeiro, e ERROR (qualquer outro
+    # caractere) por último. As strings usam a forma "desenrolada"
+    # ([^"\\]*(?:\\.[^"\\]*)*), que consome o trecho sem escapes em um único passo.
+    # NUMBER e IDENT seguem as classes \d e \w do re, não str.isdigit() e
+    # str.isalpha(): dígitos não decimais ('²', '³') e frações ('½') contam como
+    # caracteres de identificador, e não como número ou caractere inválido.
+    _MASTER: ClassVar[re.Pattern] = re.compile(r"""
+        (?P<WS>[ \t]+)
+      | (?P<IDENT>[^\W\d]\w*)
+      | (?P<OP>==|!=|<=|>=|[-+*/=<>()\[\],])
+      | (?P<NUMBER>\d+(?:\.\d*)?)
+      | (?P<NEWLINE>\n)
+      | (?P<STRING>"[^"\\]*(?:\\.[^"\\]*)*"|'[^'\\]*(?:\\.[^'\\]*)*')
+      | (?P<ERROR>.)
+    """, re.VERBOSE | re.DOTALL)
+    
+    # Tokens de valor fixo, criados uma única vez e reaproveitados por
+    # tokenize(positions=False). São imutáveis (_SharedToken), pois são
+    # compartilhados entre todos os lexers
+    _SYMBOL_TOKENS: ClassVar[Dict[Tuple[TokenType, str], _SharedToken]] = {
+        (token_type, value): _SharedToken(token_type, value)
+        for value, token_type in [*KEYWORDS.items(), *OPERATORS.items(),
+                                  ('\\n', TokenType.NEWLINE), ('', TokenType.EOF)]
+    }
+    
+    # Tabela de despacho: tipo de token de cada grupo do _MASTER, indexada
+    # pelo número do grupo (match.lastindex). None marca os grupos cujo tipo
+    # depende do valor (operadores) ou que não geram token
+    _GROUP_TYPES: ClassVar[List[Optional[TokenType]]] = [None] * (_MASTER.groups + 1)
+    _GROUP_TYPES[_MASTER.groupindex['IDENT']] = TokenType.IDENTIFIER
+    _GROUP_TYPES[_MASTER.groupindex['NUMBER']] = TokenType.NUMBER
+    _GROUP_TYPES[_MASTER.groupindex['NEWLINE']] = TokenType.NEWLINE
+    _GROUP_TYPES[_MASTER.groupindex['STRING']] = TokenType.STRING
+    _WS_GROUP: ClassVar[int] = _MASTER.groupindex['WS']
+    
     def __init__(self, text: str):
         self.text = text
         self.pos = 0  # posição atual no texto
         self.line = 1 # linha atual
         self.column = 1 # coluna atual
-        
-        # Palavras-chave da linguagem
-        self.keywords = {
-            'if': TokenType.IF,
-            'while': TokenType.WHILE,
-            'for': TokenType.FOR,
-            'print': TokenType.PRINT,
-        }
-    
-    def current_char(self) -> Optional[str]:
-        """Retorna o caractere atual ou None se chegou ao fim"""
-        if self.pos >= len(self.text):
-            return None
-        return self.text[self.pos]
-    
-    def peek_char(self, offset: int = 1) -> Optional[str]:
-        """Olha para frente sem avançar a posição"""
-        peek_pos = self.pos + offset
-        if peek_pos >= len(self.text):
-            return None
-        return self.text[peek_pos]
-    
-    def advance(self):
-        """Avança para o próximo caractere"""
-        if self.pos < len(self.text) and self.text[self.pos] == '\n':
-            self.line += 1
-            self.column = 1
-        else:
-            self.column += 1
-        self.pos += 1
-    
-    def skip_whitespace(self):
-        """Pula espaços em branco (exceto quebras de linha)"""
-        while self.current_char() and self.current_char() in ' \t':
-            self.advance()
-    
-    def read_number(self) -> Token:
-        """
-        Lê um número (inteiro ou decimal)
-        
-        Exemplos: 123, 3.14, -42
-        """
-        start_column = self.column
-        result = ""
-        
-        # Lê dígitos antes do ponto decimal
-        while self.current_char() and self.current_char().isdigit():
-            result += self.current_char()
-            self.advance()
-        
-        # Verifica se há ponto decimal
-        if self.current_char() == '.':
-            result += self.current_char()
-            self.advance()
-            
-            # Lê dígitos após o ponto decimal
-            while self.current_char() and self.current_char().isdigit():
-                result += self.current_char()
-                self.advance()
-        
-        return Token(TokenType.NUMBER, result, self.line, start_column)
+        self._stream: Optional[TokenStream] = None  # resultado de tokenize()
     
-    def read_string(self) -> Token:
+    def location(self, offset: int) -> Tuple[int, int]:
         """
-        Lê uma string entre aspas
+        Retorna (linha, coluna) de uma posição do texto
         
-        Exemplo: "Hello, World!"
+        Usa o índice de quebras de linha do TokenStream de tokenize(), que
+        é montado uma única vez; depois cada consulta é uma busca binária.
         """
-        start_column = self.column
-        quote_char = self.current_char()  # ' ou "
-        result = ""
-        
-        self.advance()  # pula a aspa inicial
-        
-        while self.current_char() and self.current_char() != quote_char:
-            if self.current_char() == '\\':  # escape sequences
-                self.advance()
-                if self.current_char() == 'n':
-                    result += '\n'
-                elif self.current_char() == 't':
-                    result += '\t'
-                elif self.current_char() == '\\':
-                    result += '\\'
-                elif self.current_char() == quote_char:
-                    result += quote_char
-                else:
-                    result += self.current_char()
-            else:
-                result += self.current_char()
-            self.advance()
-        
-        if self.current_char() == quote_char:
-            self.advance()  # pula a aspa final
-        else:
-            raise SyntaxError(f"String não fechada na linha {self.line}, coluna {start_column}")
-        
-        return Token(TokenType.STRING, result, self.line, start_column)
+        if self._stream is None:
+            self._stream = TokenStream(self.text)
+        return self._stream.offset_location(offset)
     
-    def read_identifier(self) -> Token:
-        """
-        Lê um identificador (nome de variável ou palavra-chave)
-        
-        Exemplos: x, nome_variavel, if, while
+    def tokenize(self, positions: bool = True) -> TokenStream:
         """
-        start_column = self.column
-        result = ""
+        Método principal que converte todo o texto em tokens
         
-        # Primeiro caractere deve ser letra ou _
-        while (self.current_char() and 
-               (self.current_char().isalnum() or self.current_char() == '_')):
-            result += self.current_char()
-            self.advance()
+        Percorre o texto com a expressão regular mestre (_MASTER): cada
+        casamento já diz a classe do token pelo nome do grupo, então o
+        laço em Python roda uma vez por token, e não uma vez por caractere.
         
-        # Verifica se é palavra-chave
-        token_type = self.keywords.get(result, TokenType.IDENTIFIER)
+        Args:
+            positions: se False, tokens de valor fixo (operadores,
+                palavras-chave, NEWLINE e EOF) são entregues como instâncias
+                compartilhadas com linha e coluna 0; a posição real continua
+                disponível em TokenStream.location()
         
-        return Token(token_type, result, self.line, start_column)
-    
-    def tokenize(self) -> List[Token]:
+        Retorna um TokenStream que representa o código fonte
         """
-        Método principal que converte todo o texto em tokens
+        text = self.text
+        stream = TokenStream(text, None if positions else self._SYMBOL_TOKENS)
+        if self._stream is not None:
+            stream._newlines = self._stream._newlines  # índice já montado por location()
+        self._stream = stream
         
-        Retorna uma lista de tokens que representa o código fonte
-        """
-        tokens = []
+        # Nomes locais: evitam buscas de atributo a cada token
+        add_type = stream.types.append
+        add_start = stream.starts.append
+        add_length = stream.lengths.append
+        group_types = self._GROUP_TYPES
+        operators_get = self.OPERATORS.get
+        keywords_get = self._KW_BY_LEN_CHAR.get
+        whitespace = self._WS_GROUP
+        identifier = TokenType.IDENTIFIER
         
-        while self.current_char():
-            # Pula espaços em branco
-            if self.current_char() in ' \t':
-                self.skip_whitespace()
-                continue
-            
-            # Quebra de linha
-            if self.current_char() == '\n':
-                tokens.append(Token(TokenType.NEWLINE, '\\n', self.line, self.column))
-                self.advance()
-                continue
+        for match in self._MASTER.finditer(text, self.pos):
+            group = match.lastindex
             
-            # Números
-            if self.current_char().isdigit():
-                tokens.append(self.read_number())
-                continue
-            
-            # Strings
-            if self.current_char() in '"\'':
-                tokens.append(self.read_string())
-                continue
-            
-            # Identificadores e palavras-chave
-            if self.current_char().isalpha() or self.current_char() == '_':
-                tokens.append(self.read_identifier())
-                continue
-            
-            # Operadores de dois caracteres
-            if self.current_char() == '=' and self.peek_char() == '=':
-                tokens.append(Token(TokenType.EQUAL, '==', self.line, self.column))
-                self.advance()
-                self.advance()
-                continue
-            
-            if self.current_char() == '!' and self.peek_char() == '=':
-                tokens.append(Token(TokenType.NOT_EQUAL, '!=', self.line, self.column))
-                self.advance()
-                self.advance()
-                continue
-            
-            if self.current_char() == '<' and self.peek_char() == '=':
-                tokens.append(Token(TokenType.LESS_EQUAL, '<=', self.line, self.column))
-                self.advance()
-                self.advance()
+            # Pula espaços em branco
+            if group == whitespace:
                 continue
             
-            if self.current_char() == '>' and self.peek_char() == '=':
-                tokens.append(Token(TokenType.GREATER_EQUAL, '>=', self.line, self.column))
-                self.advance()
-                self.advance()
-                continue
+            start, end = match.span()
             
-            # Operadores de um caractere
-            single_char_tokens = {
-                '+': TokenType.PLUS,
-                '-': TokenType.MINUS,
-                '*': TokenType.MULTIPLY,
-                '/': TokenType.DIVIDE,
-                '=': TokenType.ASSIGN,
-                '<': TokenType.LESS_THAN,
-                '>': TokenType.GREATER_THAN,
-                '(': TokenType.LEFT_PAREN,
-                ')': TokenType.RIGHT_PAREN,
-                '[': TokenType.LEFT_BRACKET,
-                ']': TokenType.RIGHT_BRACKET,
-                ',': TokenType.COMMA,
-            }
+            # Uma consulta à tabela decide o tipo; operadores saem do valor
+            token_type = group_types[group]
+            if token_type is None:
+                value = match.group()
+                token_type = operators_get(value)
+                if token_type is None:
+                    # Linha e coluna só são calculadas neste caminho de erro
+                    line, column = self.location(start)
+                    if value in '"\'':
+                        # Aspa que não casou com o padrão de string
+                        raise SyntaxError(f"String não fechada na linha {line}, coluna {column}")
+                    # Caractere não reconhecido
+                    raise SyntaxError(f"Caractere não reconhecido '{value}' na linha {line}, coluna {column}")
+            elif token_type is identifier:
+                # Identificadores e palavras-chave
+                value = match.group()
+                keyword = keywords_get((len(value), value[0]))
+                if keyword and keyword[0] == value:
+                    token_type = keyword[1]
             
-            if self.current_char() in single_char_tokens:
-                token_type = single_char_tokens[self.current_char()]
-                tokens.append(Token(token_type, self.current_char(), self.line, self.column))
-                self.advance()
-                continue
-            
-            # Caractere não reconhecido
-            raise SyntaxError(f"Caractere não reconhecido '{self.current_char()}' na linha {self.line}, coluna {self.column}")
+            add_type(token_type)
+            add_start(start)
+            add_length(end - start)
+        
+        # Atualiza o estado do lexer para o fim do texto
+        self.pos = len(text)
+        self.line = text.count('\n') + 1
+        self.column = self.pos - text.rfind('\n')
         
         # Adiciona token de fim de arquivo
-        tokens.append(Token(TokenType.EOF, '', self.line, self.column))
-        return tokens
+        add_type(TokenType.EOF)
+        add_start(self.pos)
+        add_length(0)
+        return stream
 
 # Exemplo de uso e teste
 if __name__ == "__main__":
@@ -1,7 +1,14 @@
-from typing import Dict, Any, Optional, List
-from dataclasses import dataclass
+from typing import Dict, Any, Iterator, Optional, List
+from dataclasses import dataclass, field
 
-@dataclass
+# Códigos inteiros dos tipos, para comparar tipos sem montar nomes:
+# pelo tipo Python do valor e pelo nome usado em var_type
+_TYPE_CODES = {int: 1, float: 2, str: 3, list: 4, bool: 5}
+_TYPE_CODES_BY_NAME = {"int": 1, "float": 2, "string": 3, "str": 3, "list": 4, "bool": 5}
+_INT_CODE = _TYPE_CODES[int]
+_FLOAT_CODE = _TYPE_CODES[float]
+
+@dataclass(slots=True, init=False)
 class Variable:
     """
     Representa uma variável com suas propriedades
@@ -12,17 +19,40 @@ class Variable:
         var_type: tipo da variável (int, float, string, list)
         is_constant: se é constante (não pode ser alterada)
         line_declared: linha onde foi declarada (para debug)
+        type_code: código inteiro de var_type (0 se desconhecido), refeito
+            a cada atribuição de var_type
     """
     name: str
     value: Any
     var_type: str
     is_constant: bool = False
     line_declared: int = 1
+    type_code: int = field(init=False, default=0, repr=False, compare=False)
+    
+    def __init__(self, name: str, value: Any, var_type: str,
+                 is_constant: bool = False, line_declared: int = 1):
+        self.name = name
+        self.value = value
+        _set_var_type_slot(self, var_type)  # direto no slot, sem passar pela property
+        self.type_code = _TYPE_CODES_BY_NAME.get(var_type, 0)
+        self.is_constant = is_constant
+        self.line_declared = line_declared
     
     def __str__(self):
         const_str = " (const)" if self.is_constant else ""
         return f"{self.name}: {self.var_type} = {self.value}{const_str}"
 
+# var_type vira uma property sobre o slot criado pelo dataclass: atribuir um
+# novo tipo a uma variável já criada também atualiza type_code
+_var_type_slot = Variable.var_type
+_set_var_type_slot = _var_type_slot.__set__
+
+def _set_var_type(variable: Variable, var_type: str):
+    _set_var_type_slot(variable, var_type)
+    variable.type_code = _TYPE_CODES_BY_NAME.get(var_type, 0)
+
+Variable.var_type = property(_var_type_slot.__get__, _set_var_type)
+
 class Scope:
     """
     Representa um escopo (contexto de variáveis)
@@ -31,6 +61,11 @@ class Scope:
     Cada bloco de código (função, if, while) pode ter seu próprio escopo.
     """
     
+    # Cache de resoluções (nome -> variável encontrada acima do pai). Só é
+    # criado na primeira busca que sobe além do pai (ver get_variable); até
+    # lá o escopo usa este valor de classe e não paga nada na criação
+    _resolved: Optional[Dict[str, Variable]] = None
+    
     def __init__(self, name: str, parent: Optional['Scope'] = None):
         self.name = name
         self.parent = parent  # escopo pai (para busca hierárquica)
@@ -39,6 +74,11 @@ class Scope:
         
         if parent:
             parent.children.append(self)
+        else:
+            # Geração das definições: um contador em lista guardado na raiz e
+            # compartilhado só pelos escopos da mesma árvore, então definir
+            # variáveis em outro ScopeManager não invalida estes caches
+            self._generation: List[int] = [0]
     
     def define_variable(self, name: str, value: Any, var_type: str = None, 
                        is_constant: bool = False, line: int = 1) -> Variable:
@@ -79,6 +119,8 @@ class Scope:
         
         variable = Variable(name, value, var_type, is_constant, line)
         self.variables[name] = variable
+        if self.children:
+            self._tree_generation()[0] += 1  # pode esconder outra já resolvida por um filho
         return variable
     
     def get_variable(self, name: str) -> Optional[Variable]:
@@ -90,23 +132,60 @@ class Scope:
         2. Se não encontrar, procura no escopo pai
         3. Continua subindo até encontrar ou chegar ao escopo global
         
+        A subida é feita com um laço (sem recursão) e o resultado fica
+        em cache até a próxima definição de variável num escopo que tenha
+        filhos.
+        
         Args:
             name: nome da variável
         
         Returns:
             Variable ou None se não encontrada
         """
-        # Primeiro procura no escopo atual
-        if name in self.variables:
-            return self.variables[name]
+        # O próprio escopo e o pai custam uma consulta cada, como o cache:
+        # só a busca nos escopos acima deles passa pelo cache, criado no uso
+        variable = self.variables.get(name)
+        if variable is not None:
+            return variable
+        
+        parent = self.parent
+        if parent is None:
+            return None
+        variable = parent.variables.get(name)
+        if variable is not None:
+            return variable
+        
+        resolved = self._resolved
+        if resolved is None:
+            self._generation = self._tree_generation()
+        generation = self._generation[0]
+        if resolved is None or self._resolved_generation != generation:
+            resolved = self._resolved = {}
+            self._resolved_generation = generation
+        else:
+            variable = resolved.get(name)
+            if variable is not None:
+                return variable
         
-        # Se não encontrou e tem escopo pai, procura lá
-        if self.parent:
-            return self.parent.get_variable(name)
+        # Procura nos escopos acima do pai, subindo pelos links de parent
+        scope = parent.parent
+        while scope is not None:
+            variable = scope.variables.get(name)
+            if variable is not None:
+                resolved[name] = variable
+                return variable
+            scope = scope.parent
         
         # Não encontrou em lugar nenhum
         return None
     
+    def _tree_generation(self) -> List[int]:
+        """Retorna o contador de gerações da árvore, guardado no escopo raiz"""
+        scope = self
+        while scope.parent is not None:
+            scope = scope.parent
+        return scope._generation
+    
     def set_variable(self, name: str, value: Any, line: int = 1) -> bool:
         """
         Atribui valor a uma variável existente
@@ -133,11 +212,14 @@ class Scope:
             raise ValueError(f"Não é possível alterar constante '{name}' (linha {line})")
         
         # Verifica compatibilidade de tipos (opcional, pode ser relaxado)
-        new_type = type(value).__name__
-        if new_type == "int" and variable.var_type == "float":
-            value = float(value)  # conversão automática int -> float
-        elif new_type != variable.var_type.replace("string", "str"):
-            print(f"Aviso: Mudando tipo de '{name}' de {variable.var_type} para {new_type}")
+        # Caso comum, mesmo tipo: basta comparar os códigos inteiros
+        new_code = _TYPE_CODES.get(type(value), 0)
+        if not new_code or new_code != variable.type_code:
+            new_type = type(value).__name__
+            if new_code == _INT_CODE and variable.type_code == _FLOAT_CODE:
+                value = float(value)  # conversão automática int -> float
+            elif new_type != variable.var_type.replace("string", "str"):
+                print(f"Aviso: Mudando tipo de '{name}' de {variable.var_type} para {new_type}")
         
         variable.value = value
         return True
@@ -154,11 +236,34 @@ class Scope:
         """
         variables = list(self.variables.values())
         
-        if include_parent and self.parent:
-            variables.extend(self.parent.list_variables(include_parent))
+        if include_parent:
+            # Sobe pelos escopos pai com um laço, estendendo a mesma lista
+            scope = self.parent
+            while scope is not None:
+                variables.extend(scope.variables.values())
+                scope = scope.parent
         
         return variables
     
+    def iter_variables(self, include_parent: bool = False) -> Iterator[Variable]:
+        """
+        Percorre as variáveis do escopo sem montar uma lista
+        
+        Mesma ordem de list_variables: primeiro o escopo atual, depois os pais.
+        
+        Args:
+            include_parent: se deve incluir variáveis dos escopos pai
+        
+        Yields:
+            Variable: cada variável encontrada
+        """
+        scope = self
+        while scope is not None:
+            yield from scope.variables.values()
+            if not include_parent:
+                break
+            scope = scope.parent
+    
     def __str__(self):
         vars_str = ", ".join([f"{name}={var.value}" for name, var in self.variables.items()])
         return f"Scope({self.name}): [{vars_str}]"
@@ -172,7 +277,79 @@ class ScopeManager:
     """
     
     def __init__(self):
-        # Escopo global
+        # Escopo global sempre existe
+        self.global_scope = Scope("global")
+        self.current_scope = self.global_scope
+        self.scope_stack = [self.global_scope]
+    
+    def enter_scope(self, name: str) -> Scope:
+        """
+        Entra em um novo escopo (cria escopo filho)
+        
+        Args:
+            name: nome do novo escopo
+        
+        Returns:
+            Scope: o novo escopo criado
+        """
+        new_scope = Scope(name, self.current_scope)
+        self.current_scope = new_scope
+        self.scope_stack.append(new_scope)
+        return new_scope
+    
+    def exit_scope(self) -> Optional[Scope]:
+        """
+        Sai do escopo atual (volta para o escopo pai)
+        
+        Returns:
+            Scope: o escopo que foi abandonado, ou None se já no global
+        """
+        if len(self.scope_stack) <= 1:
+            return None  # Não pode sair do escopo global
+        
+        old_scope = self.scope_stack.pop()
+        self.current_scope = self.scope_stack[-1]
+        return old_scope
+    
+    def define_variable(self, name: str, value: Any, **kwargs) -> Variable:
+        """Define variável no escopo atual"""
+        return self.current_scope.define_variable(name, value, **kwargs)
+    
+    def get_variable(self, name: str) -> Optional[Variable]:
+        """Busca variável no escopo atual (e pais)"""
+        return self.current_scope.get_variable(name)
+    
+    def set_variable(self, name: str, value: Any, line: int = 1) -> bool:
+        """Atribui valor a variável existente"""
+        return self.current_scope.set_variable(name, value, line)
+    
+    def get_scope_info(self) -> str:
+        """Retorna informações sobre os escopos ativos"""
+        info = []
+        for i, scope in enumerate(self.scope_stack):
+            indent = "  " * i
+            info.append(f"{indent}{scope}")
+        return "\n".join(info)
+
+# Função de exemplo para testar o sistema de escopos
+def test_scope_system():
+    """
+    Demonstra o funcionamento do sistema de escopos
+    
+    Simula a execução de código com diferentes escopos:
+    
+    x = 10          # escopo global
+    if x > 5:       # novo escopo
+        y = 20      # variável local
+        x = 15      # modifica global
+        if y > 10:  # escopo aninhado
+            z = 30  # variável mais local ainda
+    """
+    print("=== TESTE DO SISTEMA DE ESCOPOS ===\n")
+    
+    manager = ScopeManager()
+    
+    # Escopo global
     print("1. Definindo variável no escopo global:")
     manager.define_variable("x", 10, line=1)
     print(f"   x = {manager.get_variable('x').value}")
@@ -301,76 +478,4 @@ if __name__ == "__main__":
     
     print("\n" + "="*50)
     print("PRÓXIMO PASSO: Implementar tipos de dados (Capítulo 6)")
-    print("="*50)opo global sempre existe
-        self.global_scope = Scope("global")
-        self.current_scope = self.global_scope
-        self.scope_stack = [self.global_scope]
-    
-    def enter_scope(self, name: str) -> Scope:
-        """
-        Entra em um novo escopo (cria escopo filho)
-        
-        Args:
-            name: nome do novo escopo
-        
-        Returns:
-            Scope: o novo escopo criado
-        """
-        new_scope = Scope(name, self.current_scope)
-        self.current_scope = new_scope
-        self.scope_stack.append(new_scope)
-        return new_scope
-    
-    def exit_scope(self) -> Optional[Scope]:
-        """
-        Sai do escopo atual (volta para o escopo pai)
-        
-        Returns:
-            Scope: o escopo que foi abandonado, ou None se já no global
-        """
-        if len(self.scope_stack) <= 1:
-            return None  # Não pode sair do escopo global
-        
-        old_scope = self.scope_stack.pop()
-        self.current_scope = self.scope_stack[-1]
-        return old_scope
-    
-    def define_variable(self, name: str, value: Any, **kwargs) -> Variable:
-        """Define variável no escopo atual"""
-        return self.current_scope.define_variable(name, value, **kwargs)
-    
-    def get_variable(self, name: str) -> Optional[Variable]:
-        """Busca variável no escopo atual (e pais)"""
-        return self.current_scope.get_variable(name)
-    
-    def set_variable(self, name: str, value: Any, line: int = 1) -> bool:
-        """Atribui valor a variável existente"""
-        return self.current_scope.set_variable(name, value, line)
-    
-    def get_scope_info(self) -> str:
-        """Retorna informações sobre os escopos ativos"""
-        info = []
-        for i, scope in enumerate(self.scope_stack):
-            indent = "  " * i
-            info.append(f"{indent}{scope}")
-        return "\n".join(info)
-
-# Função de exemplo para testar o sistema de escopos
-def test_scope_system():
-    """
-    Demonstra o funcionamento do sistema de escopos
-    
-    Simula a execução de código com diferentes escopos:
-    
-    x = 10          # escopo global
-    if x > 5:       # novo escopo
-        y = 20      # variável local
-        x = 15      # modifica global
-        if y > 10:  # escopo aninhado
-            z = 30  # variável mais local ainda
-    """
-    print("=== TESTE DO SISTEMA DE ESCOPOS ===\n")
-    
-    manager = ScopeManager()
-    
-    # Esc
\ No newline at end of file
+    print("="*50)
\ No newline at end of file